@@ -9,7 +9,7 @@ Example: Fingerprint capture and enroll.
 :license:   The MIT License (MIT)
 """
 
-from embutils.utils import SDK_LOG
+from embutils.utils import SDK_LOG, IntEnum
 
 from fpsensor.sdk import FpSDK
 from fpsensor.api import FpBaudrate, FpBufferID
@@ -18,6 +18,82 @@ from examples.ex_utils import parse_args, wait_finger_action
 
 
 # -->> Definitions <<------------------
+#: Maximum number of attempts per enroll step
+TRIES_MAX = 3
+
+
+class State(IntEnum):
+    """
+    Enroll states.
+    """
+    CAPTURE_1   = 0x01      # Capture the first fingerprint
+    CAPTURE_2   = 0x02      # Capture the second fingerprint
+    DONE        = 0x03      # Both fingerprints captured
+
+
+def capture(sdk: FpSDK, buffer: FpBufferID) -> None:
+    """
+    Captures a fingerprint image and converts it into the given buffer.
+
+    :param FpSDK sdk:           Fingerprint SDK object.
+    :param FpBufferID buffer:   Buffer to store the converted image.
+    """
+    for tries in range(1, TRIES_MAX + 1):
+        # Wait until finger press the sensor and capture
+        wait_finger_action(sdk=sdk, press=False)
+        wait_finger_action(sdk=sdk, press=True)
+        sdk.image_capture()
+        sdk.backlight(enable=False)
+
+        # Convert the image
+        recv = sdk.image_convert(buffer=buffer)
+        if recv.succ:
+            return
+        if tries >= TRIES_MAX:
+            raise sdk.Error(message='Unable to get a good image of the fingerprint', code=recv.code)
+        print(f'Error when converting fingerprint image ({str(recv.code)}). Try again!')
+
+
+def handle_capture_1(sdk: FpSDK) -> State:
+    """
+    Captures the first fingerprint and checks that is not registered.
+
+    :param FpSDK sdk: Fingerprint SDK object.
+
+    :return: Next state.
+    :rtype: State
+    """
+    capture(sdk=sdk, buffer=FpBufferID.BUFFER_1)
+    recv = sdk.match_1_n(buffer=FpBufferID.BUFFER_1)
+    if recv.index != -1:
+        raise ValueError(f'Finger already registered on index #{recv.index}')
+    return State.CAPTURE_2
+
+
+def handle_capture_2(sdk: FpSDK) -> State:
+    """
+    Captures the second fingerprint and checks that matches the first one.
+
+    :param FpSDK sdk: Fingerprint SDK object.
+
+    :return: Next state.
+    :rtype: State
+    """
+    for tries in range(1, TRIES_MAX + 1):
+        capture(sdk=sdk, buffer=FpBufferID.BUFFER_2)
+        recv = sdk.match_1_1()
+        if recv.succ:
+            return State.DONE
+        if tries < TRIES_MAX:
+            print('Fingers dont match. Try again!')
+    raise RuntimeError('Fingers didnt match several times')
+
+
+#: State handlers
+HANDLERS = {
+    State.CAPTURE_1: handle_capture_1,
+    State.CAPTURE_2: handle_capture_2,
+    }
 
 
 # -->> Example <<----------------------
@@ -30,43 +106,9 @@ def example(sdk: FpSDK):
         sdk.backlight(enable=False)
 
         # Repeat this until both fingerprints are detected correctly
-        tries  = 0
-        buffer = FpBufferID.BUFFER_1
-        while True:
-            # Wait until finger press the sensor and capture
-            wait_finger_action(sdk=sdk, press=False)
-            wait_finger_action(sdk=sdk, press=True)
-            sdk.image_capture()
-            sdk.backlight(enable=False)
-
-            # Convert the image
-            recv = sdk.image_convert(buffer=buffer)
-            if not recv.succ:
-                tries += 1
-                if tries >= 3:
-                    raise sdk.Error(message='Unable to get a good image of the fingerprint', code=recv.code)
-                print(f'Error when converting fingerprint image ({str(recv.code)}). Try again!')
-                continue
-            tries = 0
-
-            # Continue depending on buffer
-            if buffer == FpBufferID.BUFFER_1:
-                # Check that finger is not registered
-                recv = sdk.match_1_n(buffer=buffer)
-                if recv.index != -1:
-                    raise ValueError(f'Finger already registered on index #{recv.index}')
-                buffer = FpBufferID.BUFFER_2
-
-            elif buffer == FpBufferID.BUFFER_2:
-                # Check that fingers match
-                recv = sdk.match_1_1()
-                if not recv.succ:
-                    tries += 1
-                    if tries >= 3:
-                        raise RuntimeError('Fingers didnt match several times')
-                    print('Fingers dont match. Try again!')
-                    continue
-                break
+        state = State.CAPTURE_1
+        while state != State.DONE:
+            state = HANDLERS[state](sdk=sdk)
 
         # Generate template
         recv = sdk.template_create()
@@ -74,7 +116,7 @@ def example(sdk: FpSDK):
             raise sdk.Error(message='Template creation failed', code=recv.code)
 
         # Store the template
-        recv = sdk.template_save(buffer=buffer)
+        recv = sdk.template_save(buffer=FpBufferID.BUFFER_2)
         if not recv.succ:
             raise sdk.Error(message='Template store failed', code=recv.code)
         print(f'Fingerprint stored successfully on index #{recv.value}')
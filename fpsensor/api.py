@@ -9,7 +9,7 @@ Fingerprint API definitions.
 :license:   The MIT License (MIT)
 """
 
-import math
+import struct
 import typing as tp
 
 import attr
@@ -22,6 +22,16 @@ PASSWORD        = 0x00000000        # Default password
 NOTEPAD_SIZE    = 32                # Notepad size : 32 bytes per page
 NOTEPAD_COUNT   = 16                # Notepad count: 16 pages
 
+#: Precompiled big-endian packers, indexed by size in bytes
+_PACKERS = {
+    1: struct.Struct('>B'),
+    2: struct.Struct('>H'),
+    4: struct.Struct('>I'),
+    }
+
+#: System parameters layout: status, ID, capacity, security, address, packet size, baudrate
+_SYSPARAM = struct.Struct('>HHHHIHH')
+
 
 class FpPID(embu.IntEnum):
     """
@@ -73,6 +83,16 @@ class FpCommand(embu.IntEnum):
     BACKLIGHT_ON            = 0x50
     BACKLIGHT_OFF           = 0x51
 
+    def __str__(self) -> str:
+        """
+        Class object as string. Uses the precomputed names table.
+        """
+        return _COMMAND_NAMES[self]
+
+
+#: Command names, precomputed for logging
+_COMMAND_NAMES = {item: embu.IntEnum.__str__(item) for item in FpCommand.__members__.values()}
+
 
 class FpError(embu.IntEnum):
     """
@@ -121,6 +141,16 @@ class FpError(embu.IntEnum):
     ERROR_DATABASE_FULL                 = 0xFE
     ERROR_TIMEOUT                       = 0xFF
 
+    def __str__(self) -> str:
+        """
+        Class object as string. Uses the precomputed names table.
+        """
+        return _ERROR_NAMES[self]
+
+
+#: Error names, precomputed for logging
+_ERROR_NAMES = {item: embu.IntEnum.__str__(item) for item in FpError.__members__.values()}
+
 
 class FpBufferID(embu.IntEnum):
     """
@@ -177,14 +207,20 @@ class FpBaudrate(embu.IntEnum):
         :return: Fingerprint baudrate code.
         :rtype: FpBaudrate
         """
-        if cls.has_value(value=value):
-            return FpBaudrate(value)
-        val = (value // 9600)
-        if cls.has_value(value=val):
-            return FpBaudrate(val)
+        item = _BAUDRATE_BY_INT.get(value)
+        if item is None:
+            item = enum_member(enum=cls, value=value)
+        if item is None:
+            item = enum_member(enum=cls, value=(value // 9600))
+        if item is not None:
+            return item
         raise ValueError(f"Value {value} is not supported by the sensor.")
 
 
+#: Baudrate definitions indexed by baudrate value
+_BAUDRATE_BY_INT = {item.to_int(): item for item in FpBaudrate.__members__.values()}
+
+
 class FpPacketSize(embu.IntEnum):
     """
     Fingerprint packet sizes.
@@ -203,6 +239,19 @@ class FpPacketSize(embu.IntEnum):
         """
         return 32 * (2 ** self)
 
+    def recommended_read_size(self) -> int:
+        """
+        Returns the number of bytes that a full data packet of this size takes on the wire. This allows the transport
+        to request an entire packet on a single read.
+
+        .. note::
+            The packet overhead is `11` bytes: header, address, PID, length and checksum.
+
+        :return: Read size.
+        :rtype: int
+        """
+        return self.to_int() + 11
+
     @classmethod
     def from_int(cls, value: int) -> 'FpPacketSize':
         """
@@ -213,14 +262,21 @@ class FpPacketSize(embu.IntEnum):
         :return: Fingerprint packet size code.
         :rtype: FpBaudrate
         """
-        if cls.has_value(value=value):
-            return FpPacketSize(value)
-        val = int(math.log2(value >> 5))
-        if cls.has_value(value=val):
-            return FpPacketSize(val)
+        item = _PACKET_SIZE_BY_INT.get(value)
+        if item is None:
+            item = enum_member(enum=cls, value=value)
+        if item is None:
+            shifted = value >> 5
+            item = enum_member(enum=cls, value=((shifted.bit_length() - 1) if shifted > 0 else -1))
+        if item is not None:
+            return item
         raise ValueError(f"Value {value} is not a compatible packet size.")
 
 
+#: Packet size definitions indexed by packet size value
+_PACKET_SIZE_BY_INT = {item.to_int(): item for item in FpPacketSize.__members__.values()}
+
+
 class FpParameterID(embu.IntEnum):
     """
     Fingerprint editable parameters.
@@ -236,17 +292,22 @@ class FpParameterID(embu.IntEnum):
         :return: Parameter data type.
         :rtype: Type[FpBaudrate, FpSecurity, FpPacketSize]
         """
-        if self == self.BAUDRATE:
-            return FpBaudrate
-        if self == self.SECURITY:
-            return FpSecurity
-        if self == self.PACKET_SIZE:
-            return FpPacketSize
-        raise ValueError('Parameter type not implemented')
+        try:
+            return _PARAMETER_TYPES[self]
+        except KeyError as error:
+            raise ValueError('Parameter type not implemented') from error
+
+
+#: Data type for each editable parameter
+_PARAMETER_TYPES: tp.Dict[int, tp.Type[tp.Union[FpBaudrate, FpSecurity, FpPacketSize]]] = {
+    FpParameterID.BAUDRATE:     FpBaudrate,
+    FpParameterID.SECURITY:     FpSecurity,
+    FpParameterID.PACKET_SIZE:  FpPacketSize,
+    }
 
 
 # -->> API <<--------------------------
-@attr.s
+@attr.s(repr=False, frozen=True)
 class FpSystemParameters(embu.AbstractSerialized):
     """
     Fingerprint system parameters structure definition.
@@ -271,33 +332,45 @@ class FpSystemParameters(embu.AbstractSerialized):
     SIZE_MIN = 16
 
     #: Device Status
-    status:     int = attr.ib(repr=lambda v: f"0x{v:04X}")
+    status:     int = attr.ib()
     #: Device ID
-    id:         int = attr.ib(repr=lambda v: f"0x{v:04X}")
+    id:         int = attr.ib()
     #: Device address
-    address:    int = attr.ib(repr=lambda v: f"0x{v:08X}")
+    address:    int = attr.ib()
     #: Database capacity
     capacity:   int = attr.ib()
     #: Packet size
-    packet:     FpPacketSize = attr.ib(repr=lambda v: str(v))
+    packet:     FpPacketSize = attr.ib()
     #: Security level
-    security:   FpSecurity   = attr.ib(repr=lambda v: str(v))
+    security:   FpSecurity   = attr.ib()
     #: System baudrate
-    baudrate:   FpBaudrate   = attr.ib(repr=lambda v: str(v))
+    baudrate:   FpBaudrate   = attr.ib()
+
+    def __repr__(self) -> str:
+        """
+        Representation string. Computed once and cached outside the attrs fields.
+        """
+        text: tp.Optional[str] = self.__dict__.get('_repr')
+        if text is None:
+            text = (
+                f'{self.__class__.__name__}('
+                f'status=0x{self.status:04X}, id=0x{self.id:04X}, address=0x{self.address:08X}, '
+                f'capacity={self.capacity}, packet={self.packet}, security={self.security}, '
+                f'baudrate={self.baudrate})'
+                )
+            object.__setattr__(self, '_repr', text)
+        return text
 
     def serialize(self) -> bytearray:
         """
         Convert the packet into a byte array.
         """
-        return bytearray(
-            to_bytes(value=self.status, size=2) +
-            to_bytes(value=self.id, size=2) +
-            to_bytes(value=self.capacity, size=2) +
-            to_bytes(value=self.security, size=2) +
-            to_bytes(value=self.address, size=2) +
-            to_bytes(value=self.packet, size=2) +
-            to_bytes(value=self.baudrate, size=2)
+        data = bytearray(_SYSPARAM.size)
+        _SYSPARAM.pack_into(
+            data, 0,
+            self.status, self.id, self.capacity, int(self.security), self.address, int(self.packet), int(self.baudrate)
             )
+        return data
 
     @classmethod
     def deserialize(cls, data: bytearray) -> tp.Optional['FpSystemParameters']:
@@ -314,24 +387,21 @@ class FpSystemParameters(embu.AbstractSerialized):
             return None
 
         # Parse data
-        _stat   = from_bytes(data=data[0:2])
-        _id     = from_bytes(data=data[2:4])
-        _cap    = from_bytes(data=data[4:6])
-        _sec    = from_bytes(data=data[6:8])
-        _addr   = from_bytes(data=data[8:12])
-        _pack   = from_bytes(data=data[12:14])
-        _baud   = from_bytes(data=data[14:16])
+        _stat, _id, _cap, _sec, _addr, _pack, _baud = _SYSPARAM.unpack_from(memoryview(data))
 
         # Check security
-        if not FpSecurity.has_value(value=_sec):
+        _sec = enum_member(enum=FpSecurity, value=_sec)
+        if _sec is None:
             return None
 
         # Check packet size
-        if not FpPacketSize.has_value(value=_pack):
+        _pack = enum_member(enum=FpPacketSize, value=_pack)
+        if _pack is None:
             return None
 
         # Check baudrate
-        if not FpBaudrate.has_value(value=_baud):
+        _baud = enum_member(enum=FpBaudrate, value=_baud)
+        if _baud is None:
             return None
 
         # Parse
@@ -339,57 +409,69 @@ class FpSystemParameters(embu.AbstractSerialized):
             status=(0x0F & _stat),
             id=_id,
             capacity=_cap,
-            security=FpSecurity(_sec),
+            security=_sec,
             address=_addr,
-            packet=FpPacketSize(_pack),
-            baudrate=FpBaudrate(_baud)
+            packet=_pack,
+            baudrate=_baud
             )
 
 
-@attr.s
-class FpResponseSet:
+class FpResponseSet(tp.NamedTuple):
     """
     Set command response.
 
     :attr bool succ:    True if the command succeed, false otherwise.
     :attr FpError code: Command response code.
+
+    .. note::
+        The responses are named tuples: they compare equal to any tuple holding the same values.
     """
-    succ:   bool    = attr.ib()
-    code:   FpError = attr.ib()
+    succ:   bool
+    code:   FpError
 
 
-@attr.s
-class FpResponseGet(FpResponseSet):
+class FpResponseGet(tp.NamedTuple):
     """
     Get command response.
 
-    :attr bytearray pack: Response packet data without the response code byte.
-    :attr bytearray data: Response data.
+    :attr bool succ:        True if the command succeed, false otherwise.
+    :attr FpError code:     Command response code.
+    :attr bytearray pack:   Response packet data without the response code byte.
+    :attr bytearray data:   Response data.
     """
-    pack:   bytearray = attr.ib()
-    data:   bytearray = attr.ib()
+    succ:   bool
+    code:   FpError
+    pack:   bytearray
+    data:   bytearray
 
 
-@attr.s
-class FpResponseMatch(FpResponseSet):
+class FpResponseMatch(tp.NamedTuple):
     """
     Fingerprint match response.
 
-    :attr int index: Index of the matching fingerprint on database. -1 if no available.
-    :attr int score: Matching fingerprint accuracy score.
+    :attr bool succ:    True if the command succeed, false otherwise.
+    :attr FpError code: Command response code.
+    :attr int index:    Index of the matching fingerprint on database. -1 if no available.
+                        This field replaces the inherited `tuple.index` method.
+    :attr int score:    Matching fingerprint accuracy score.
     """
-    index:  int = attr.ib()
-    score:  int = attr.ib()
+    succ:   bool
+    code:   FpError
+    index:  int     # type: ignore[assignment]
+    score:  int
 
 
-@attr.s
-class FpResponseValue(FpResponseSet):
+class FpResponseValue(tp.NamedTuple):
     """
     Command value response.
 
+    :attr bool succ:    True if the command succeed, false otherwise.
+    :attr FpError code: Command response code.
     :attr Union[None, int, bytearray, Image.Image, FpSystemParameters] value: Response value (depends on command).
     """
-    value:  tp.Union[None, int, bytearray, PilI.Image, FpSystemParameters] = attr.ib()
+    succ:   bool
+    code:   FpError
+    value:  tp.Union[None, int, bytearray, PilI.Image, FpSystemParameters]
 
 
 def to_bytes(value: int, size: int) -> bytearray:
@@ -401,17 +483,41 @@ def to_bytes(value: int, size: int) -> bytearray:
 
     :return: Value bytes.
     :rtype: bytearray
+
+    :raise OverflowError: Raise if the value doesn't fit in the given number of bytes.
     """
-    return bytearray(value.to_bytes(length=size, byteorder='big', signed=False))
+    packer = _PACKERS.get(size)
+    if packer is None:
+        return bytearray(value.to_bytes(length=size, byteorder='big', signed=False))
+    try:
+        return bytearray(packer.pack(value))
+    except struct.error as error:
+        raise OverflowError(f'Value {value} does not fit in {size} unsigned bytes') from error
 
 
-def from_bytes(data: bytearray) -> int:
+def from_bytes(data: tp.Union[bytes, bytearray, memoryview]) -> int:
     """
-    Retrieves an integer value from a bytearray.
+    Retrieves an integer value from a bytes-like object.
 
-    :param bytearray data: Input bytes.
+    :param Union[bytes, bytearray, memoryview] data: Input bytes.
 
     :return: Value.
     :rtype: int
     """
-    return int.from_bytes(bytes=data, byteorder='big', signed=False)
+    packer = _PACKERS.get(len(data))
+    if packer is None:
+        return int.from_bytes(bytes=data, byteorder='big', signed=False)
+    return packer.unpack_from(data)[0]
+
+
+def enum_member(enum: tp.Type[embu.IntEnum], value: int) -> tp.Optional[embu.IntEnum]:
+    """
+    Retrieves the enumeration member for the given value using a single lookup.
+
+    :param Type[IntEnum] enum:  Enumeration type.
+    :param int value:           Value to be converted.
+
+    :return: None if the value is not defined on the enumeration, enumeration member otherwise.
+    :rtype: IntEnum
+    """
+    return getattr(enum, '_value2member_map_').get(value)
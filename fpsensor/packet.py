@@ -9,16 +9,19 @@ Fingerprint packet.
 :license:   The MIT License (MIT)
 """
 
+import struct
 import typing as tp
 
 import attr
 import embutils.serial as embs
 import embutils.utils as embu
 
-from .api import ADDRESS, FpPID, to_bytes, from_bytes
+from .api import ADDRESS, FpPID, enum_member, to_bytes, from_bytes
 
 
 # -->> Definitions <<------------------
+#: Packet head layout: header, address, PID, length
+_HEAD = struct.Struct('>HIBH')
 
 
 # -->> API <<--------------------------
@@ -63,7 +66,8 @@ class FpPacket(embu.AbstractSerialized):
         Packet checksum.
         This value computes a checksum over the PID, length and packet data.
         """
-        return 0xFFFF & sum(self._core())
+        length = self.length
+        return 0xFFFF & (self.pid + (length >> 8) + (0xFF & length) + sum(self.packet))
 
     @property
     def length(self) -> int:
@@ -73,27 +77,14 @@ class FpPacket(embu.AbstractSerialized):
         """
         return len(self.packet) + 2
 
-    def _core(self) -> bytearray:
-        """
-        Raw packet data. This group was defined to ease the checksum
-        computation. The contents are: PID, length and packet data.
-        """
-        return bytearray(
-            bytes([self.pid]) +
-            to_bytes(value=self.length, size=2) +
-            self.packet
-            )
-
     def serialize(self) -> bytearray:
         """
         Converts the packet into a byte array.
         """
-        return bytearray(
-            to_bytes(value=self.HEADER, size=2) +
-            to_bytes(value=self.address, size=4) +
-            self._core() +
-            to_bytes(value=self.checksum, size=2)
-            )
+        data = bytearray(_HEAD.pack(self.HEADER, self.address, self.pid, self.length))
+        data.extend(self.packet)
+        data.extend(to_bytes(value=self.checksum, size=2))
+        return data
 
     @classmethod
     def deserialize(cls, data: bytearray) -> tp.Optional['FpPacket']:
@@ -105,24 +96,25 @@ class FpPacket(embu.AbstractSerialized):
             return None
 
         # Check for packet fixed header
-        head = from_bytes(data=data[0:2])
+        view = memoryview(data)
+        head, addr, pid, pkt_len = _HEAD.unpack_from(view)
         if head != FpPacket.HEADER:
             return None
 
         # Check message PID
-        if not FpPID.has_value(value=data[6]):
+        pid = enum_member(enum=FpPID, value=pid)
+        if pid is None:
             return None
 
         # Parse packet bytes
         tmp = FpPacket(
-            address=from_bytes(data=data[2:6]),
-            pid=FpPID(data[6]),
+            address=addr,
+            pid=pid,
             packet=data[9:-2]
             )
 
         # Check consistency using CRC
-        pkt_len = from_bytes(data=data[7:9])
-        checksum = from_bytes(data=data[-2:])
+        checksum = from_bytes(data=view[-2:])
         if (pkt_len != tmp.length) or (checksum != tmp.checksum):
             return None
         return tmp
@@ -190,7 +182,7 @@ class FpStreamFramingCodec(embs.AbstractSerializedStreamCodec):
 
             elif self._state == self.State.WAIT_BASE:
                 # Check for length to define missing bytes
-                tmp = from_bytes(data=self._recv[7:9])
+                tmp = _HEAD.unpack_from(self._recv)[3]
                 self._count = FpPacket.SIZE_MIN + tmp - 2
                 self._state = self.State.WAIT_DATA
 
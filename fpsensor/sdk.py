@@ -109,6 +109,11 @@ class FpSDK(embs.Interface):
         :param bool looped:     Enable test mode (with looped serial).
 
         :raise ValueError: Raise if address or password values are not in a valid range.
+
+        .. note::
+            For large transfers (image and template download/upload) use
+            :attr:`FpPacketSize.PACKET_SIZE_256` (see :attr:`packet_size`). Bigger packets mean fewer packets and
+            serial reads per transfer.
         """
         # Public events
         self.on_finger_pressed  = embu.EventHook()
@@ -565,8 +570,8 @@ class FpSDK(embs.Interface):
             return recv
 
         # Verify
-        recv = self.buffer_download(buffer=buffer)
-        succ = (recv.value == data)
+        down = self.buffer_download(buffer=buffer)
+        succ = (down.value == data)
         code = FpError.SUCCESS if succ else FpError.ERROR_TEMPLATE_UPLOAD
         return FpResponseSet(succ=succ, code=code)
 
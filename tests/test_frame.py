@@ -50,6 +50,13 @@ class Test(unittest.TestCase):
         assert pack is not None
         assert pack.serialize() == data
 
+    def test_deserialize_faulty(self):
+        """
+        Check if packets with a wrong checksum are rejected.
+        """
+        data = bytearray([0xEF, 0x01, 0xFF, 0xFF, 0xFF, 0xFF, 0x01, 0x00, 0x03, 0x01, 0x00, 0x06])
+        assert FpPacket.deserialize(data=data) is None
+
     def test_comparison(self):
         """
         Check if the comparison of packets is being done correctly.
@@ -0,0 +1,142 @@
+#!/usr/bin/python
+# -*- coding: ascii -*-
+"""
+Test: Fingerprint system parameters capabilities:
+
+* Serialization
+* Deserialization
+
+:date:      2021
+:author:    Christian Wiche
+:contact:   cwichel@gmail.com
+:license:   The MIT License (MIT)
+"""
+
+# External ======================================
+import unittest
+import unittest.mock as mock
+
+import attr
+
+# Internal ======================================
+from fpsensor.api import FpBaudrate, FpPacketSize, FpParameterID, FpSecurity, FpSystemParameters
+
+
+# Definitions ===================================
+class Test(unittest.TestCase):
+    """
+    Test basic system parameters operations.
+    """
+    DATA = bytearray([
+        0x00, 0x04, 0x00, 0x09, 0x00, 0xA3, 0x00, 0x03,
+        0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0x02, 0x00, 0x06
+        ])
+
+    def test_serialize(self):
+        """
+        Check if the serialization of the parameters is being done correctly.
+        """
+        params = FpSystemParameters(
+            status=0x04, id=0x09, address=0xFFFFFFFF, capacity=0xA3,
+            packet=FpPacketSize.PACKET_SIZE_128,
+            security=FpSecurity.SECURITY_LVL3,
+            baudrate=FpBaudrate.BAUDRATE_57600
+            )
+
+        # Compare
+        assert params.serialize() == self.DATA
+
+    def test_deserialize(self):
+        """
+        Check if the deserialization of the parameters is being done correctly.
+        """
+        params = FpSystemParameters.deserialize(data=self.DATA)
+
+        # Check
+        assert params is not None
+        assert params.address == 0xFFFFFFFF
+        assert params.baudrate == FpBaudrate.BAUDRATE_57600
+        assert params.serialize() == self.DATA
+
+    def test_representation(self):
+        """
+        Check if the representation string is generated correctly.
+        """
+        params = FpSystemParameters.deserialize(data=self.DATA)
+        assert 'address=0xFFFFFFFF' in repr(params)
+        assert repr(params) is repr(params)
+
+        params = attr.evolve(params, address=0x12345678)
+        assert 'address=0x12345678' in repr(params)
+
+        # The cache is not part of the fields
+        assert '_repr' not in attr.asdict(params)
+        assert len(attr.fields(FpSystemParameters)) == 7
+
+    def test_immutable(self):
+        """
+        Check if the parameters can't be modified.
+        """
+        params = FpSystemParameters.deserialize(data=self.DATA)
+        with self.assertRaises(attr.exceptions.FrozenInstanceError):
+            params.address = 0x12345678
+
+    def test_deserialize_invalid(self):
+        """
+        Check if invalid parameters are rejected.
+        """
+        # Too short
+        assert FpSystemParameters.deserialize(data=self.DATA[:-1]) is None
+
+        # Unsupported baudrate
+        data = self.DATA.copy()
+        data[15] = 0x00
+        assert FpSystemParameters.deserialize(data=data) is None
+
+    def test_parameter_type(self):
+        """
+        Check if each parameter is mapped to its data type.
+        """
+        assert FpParameterID.BAUDRATE.get_type() is FpBaudrate
+        assert FpParameterID.SECURITY.get_type() is FpSecurity
+        assert FpParameterID.PACKET_SIZE.get_type() is FpPacketSize
+
+    def test_parameter_type_unmapped(self):
+        """
+        Check if a parameter without data type raises an error.
+        """
+        with mock.patch.dict('fpsensor.api._PARAMETER_TYPES', clear=True):
+            with self.assertRaises(ValueError):
+                FpParameterID.BAUDRATE.get_type()
+
+    def test_baudrate_from_int(self):
+        """
+        Check if the baudrates are being converted correctly.
+        """
+        assert FpBaudrate.from_int(value=0x06) == FpBaudrate.BAUDRATE_57600
+        assert FpBaudrate.from_int(value=115200) == FpBaudrate.BAUDRATE_115200
+        with self.assertRaises(ValueError):
+            FpBaudrate.from_int(value=1200)
+
+    def test_packet_size_from_int(self):
+        """
+        Check if the packet sizes are being converted correctly.
+        """
+        assert FpPacketSize.from_int(value=0x02) == FpPacketSize.PACKET_SIZE_128
+        assert FpPacketSize.from_int(value=64) == FpPacketSize.PACKET_SIZE_64
+        assert FpPacketSize.from_int(value=256) == FpPacketSize.PACKET_SIZE_256
+        with self.assertRaises(ValueError):
+            FpPacketSize.from_int(value=16)
+
+    def test_packet_size_read_size(self):
+        """
+        Check if the read size covers the full packet.
+        """
+        assert FpPacketSize.PACKET_SIZE_32.recommended_read_size() == 43
+        assert FpPacketSize.PACKET_SIZE_256.recommended_read_size() == 267
+
+
+# Execution =====================================
+if __name__ == '__main__':
+    # Execute the tests
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/python
+# -*- coding: ascii -*-
+"""
+Test: Fingerprint SDK responses capabilities:
+
+* Construction
+* Field access
+
+:date:      2021
+:author:    Christian Wiche
+:contact:   cwichel@gmail.com
+:license:   The MIT License (MIT)
+"""
+
+# External ======================================
+import unittest
+
+
+# Internal ======================================
+from fpsensor.api import FpError, FpResponseSet, FpResponseGet, FpResponseMatch, FpResponseValue
+
+
+# Definitions ===================================
+class Test(unittest.TestCase):
+    """
+    Test basic response operations.
+    """
+    def test_construction(self):
+        """
+        Check if the responses can be built with keyword and positional arguments.
+        """
+        resp_kw = FpResponseMatch(succ=True, code=FpError.SUCCESS, index=3, score=120)
+        resp_ps = FpResponseMatch(True, FpError.SUCCESS, 3, 120)
+
+        # Compare
+        assert resp_kw == resp_ps
+        assert resp_kw != FpResponseMatch(succ=False, code=FpError.ERROR_FINGER_NOT_FOUND, index=-1, score=0)
+
+    def test_field_access(self):
+        """
+        Check if the response fields are accessible by name.
+        """
+        resp = FpResponseSet(succ=False, code=FpError.ERROR_TIMEOUT)
+        assert not resp.succ
+        assert resp.code == FpError.ERROR_TIMEOUT
+
+        resp = FpResponseGet(succ=True, code=FpError.SUCCESS, pack=bytearray([0x01]), data=bytearray())
+        assert resp.pack == bytearray([0x01])
+        assert resp.data == bytearray()
+
+        resp = FpResponseMatch(succ=True, code=FpError.SUCCESS, index=3, score=120)
+        assert resp.index == 3
+        assert resp.score == 120
+
+        resp = FpResponseValue(succ=True, code=FpError.SUCCESS, value=42)
+        assert resp.value == 42
+
+    def test_immutable(self):
+        """
+        Check if the responses can't be modified.
+        """
+        resp = FpResponseValue(succ=True, code=FpError.SUCCESS, value=42)
+        with self.assertRaises(AttributeError):
+            resp.value = 0
+
+
+# Execution =====================================
+if __name__ == '__main__':
+    # Execute the tests
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/python
+# -*- coding: ascii -*-
+"""
+Test: Fingerprint API utilities:
+
+* Integer to bytes conversion
+* Bytes to integer conversion
+* Enumeration names
+
+:date:      2021
+:author:    Christian Wiche
+:contact:   cwichel@gmail.com
+:license:   The MIT License (MIT)
+"""
+
+# External ======================================
+import unittest
+
+
+# Internal ======================================
+from fpsensor.api import FpCommand, FpError, to_bytes, from_bytes
+
+
+# Definitions ===================================
+class Test(unittest.TestCase):
+    """
+    Test the byte conversion utilities.
+    """
+    def test_to_bytes(self):
+        """
+        Check if the integers are being converted correctly.
+        """
+        assert to_bytes(value=0x01, size=1) == bytearray([0x01])
+        assert to_bytes(value=0x0102, size=2) == bytearray([0x01, 0x02])
+        assert to_bytes(value=0x01020304, size=4) == bytearray([0x01, 0x02, 0x03, 0x04])
+        assert to_bytes(value=0x010203, size=3) == bytearray([0x01, 0x02, 0x03])
+
+    def test_to_bytes_overflow(self):
+        """
+        Check if out of range values raise an overflow error.
+        """
+        with self.assertRaises(OverflowError):
+            to_bytes(value=70000, size=2)
+        with self.assertRaises(OverflowError):
+            to_bytes(value=-1, size=2)
+        with self.assertRaises(OverflowError):
+            to_bytes(value=0x01000000, size=3)
+
+    def test_from_bytes(self):
+        """
+        Check if the bytes are being converted correctly.
+        """
+        assert from_bytes(data=bytearray([0x01, 0x02])) == 0x0102
+        assert from_bytes(data=bytearray([0x01, 0x02, 0x03, 0x04])) == 0x01020304
+        assert from_bytes(data=bytearray([0x01, 0x02, 0x03])) == 0x010203
+        assert from_bytes(data=bytearray()) == 0
+        assert from_bytes(data=memoryview(bytearray([0xAB, 0x01, 0x02]))[1:]) == 0x0102
+
+    def test_enum_str(self):
+        """
+        Check if the enumerations keep the expected string format.
+        """
+        assert str(FpError.SUCCESS) == 'SUCCESS(0x0)'
+        assert str(FpError.ERROR_TIMEOUT) == 'ERROR_TIMEOUT(0xFF)'
+        assert str(FpError.ERROR_PACKET_FAULTY) == 'ERROR_TEMPLATE_UPLOAD(0xFD)'
+        assert str(FpCommand.HANDSHAKE) == 'HANDSHAKE(0x53)'
+        assert repr(FpCommand.HANDSHAKE) == 'FpCommand(HANDSHAKE(0x53))'
+
+
+# Execution =====================================
+if __name__ == '__main__':
+    # Execute the tests
+    unittest.main()